@@ -2,6 +2,7 @@
 
 import os
 import sys
+import asyncio
 from typing import Optional
 from huckleberry_api import HuckleberryAPI
 
@@ -19,9 +20,17 @@ class HuckleberryAuth:
         self.email: Optional[str] = None
         self.password: Optional[str] = None
         self.timezone: Optional[str] = None
+        self._lock = asyncio.Lock()
 
     def load_credentials(self) -> None:
-        """Load credentials from environment variables."""
+        """Load credentials from environment variables.
+
+        Reads the environment only once per instance; later calls reuse the
+        values already loaded.
+        """
+        if self.email and self.password:
+            return
+
         self.email = os.getenv("HUCKLEBERRY_EMAIL")
         self.password = os.getenv("HUCKLEBERRY_PASSWORD")
         self.timezone = os.getenv("HUCKLEBERRY_TIMEZONE", "America/New_York")
@@ -69,7 +78,18 @@ _auth = HuckleberryAuth()
 
 
 async def get_authenticated_api() -> HuckleberryAPI:
-    """Get an authenticated Huckleberry API instance."""
-    if not _auth.api:
-        await _auth.authenticate()
+    """Get an authenticated Huckleberry API instance.
+
+    Concurrent callers racing on a cold start are serialized by a lock so
+    only one of them performs the authentication round trip.
+    """
+    if _auth.api:
+        return _auth.api
+
+    async with _auth._lock:
+        # Re-check inside the lock: another coroutine may have finished
+        # authenticating while we waited.
+        if _auth.api is None:
+            await _auth.authenticate()
+
     return _auth.get_api()
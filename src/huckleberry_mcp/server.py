@@ -4,11 +4,13 @@ import sys
 import asyncio
 from fastmcp import FastMCP
 
+from huckleberry_mcp.auth import get_authenticated_api
 from huckleberry_mcp.tools.children import register_children_tools
 from huckleberry_mcp.tools.sleep import register_sleep_tools
 from huckleberry_mcp.tools.feeding import register_feeding_tools
 from huckleberry_mcp.tools.diaper import register_diaper_tools
 from huckleberry_mcp.tools.growth import register_growth_tools
+from huckleberry_mcp.tools.batch import register_batch_tools
 
 
 # Create FastMCP server instance
@@ -20,6 +22,17 @@ register_sleep_tools(mcp)
 register_feeding_tools(mcp)
 register_diaper_tools(mcp)
 register_growth_tools(mcp)
+register_batch_tools(mcp)
+
+
+def _log_warmup_result(task: asyncio.Task) -> None:
+    """Log the outcome of the background auth warmup without crashing."""
+    if task.cancelled():
+        # Server shut down before the warmup finished; nothing to report
+        return
+    exc = task.exception()
+    if exc is not None:
+        print(f"Auth warmup failed (will retry lazily): {exc}", file=sys.stderr)
 
 
 async def main():
@@ -28,8 +41,13 @@ async def main():
         print("Initializing Huckleberry MCP server...", file=sys.stderr)
         print("Server ready and waiting for requests", file=sys.stderr)
 
+        # Warm up authentication in the background so the first tool call
+        # doesn't pay the full auth round trip. If this fails, tools fall
+        # back to authenticating lazily on first use.
+        warmup = asyncio.create_task(get_authenticated_api())
+        warmup.add_done_callback(_log_warmup_result)
+
         # Run the server using FastMCP's async method
-        # Authentication will happen lazily when tools are called
         await mcp.run_async()
 
     except Exception as e:
@@ -0,0 +1,162 @@
+"""Batch execution tools for Huckleberry MCP server.
+
+Allows an MCP client to fan several tool invocations out in a single
+round trip instead of paying protocol overhead once per call.
+"""
+
+import asyncio
+from typing import Any, Dict, List
+
+from .children import list_children, get_child_name
+from .sleep import (
+    log_sleep,
+    start_sleep,
+    pause_sleep,
+    resume_sleep,
+    complete_sleep,
+    cancel_sleep,
+    get_sleep_history,
+)
+from .feeding import (
+    log_bottle_feeding,
+    log_bottle_feedings,
+    log_breastfeeding,
+    start_breastfeeding,
+    pause_feeding,
+    resume_feeding,
+    switch_feeding_side,
+    complete_feeding,
+    cancel_feeding,
+    get_feeding_history,
+)
+from .diaper import log_diaper, log_diapers_batch, get_diaper_history
+from .growth import log_growth, get_latest_growth, get_growth_history
+
+
+# Tool name -> coroutine function, built once at import. batch_execute
+# itself is deliberately absent so batches cannot nest.
+DISPATCH = {
+    "list_children": list_children,
+    "get_child_name": get_child_name,
+    "log_sleep": log_sleep,
+    "start_sleep": start_sleep,
+    "pause_sleep": pause_sleep,
+    "resume_sleep": resume_sleep,
+    "complete_sleep": complete_sleep,
+    "cancel_sleep": cancel_sleep,
+    "get_sleep_history": get_sleep_history,
+    "log_bottle_feeding": log_bottle_feeding,
+    "log_bottle_feedings": log_bottle_feedings,
+    "log_breastfeeding": log_breastfeeding,
+    "start_breastfeeding": start_breastfeeding,
+    "pause_feeding": pause_feeding,
+    "resume_feeding": resume_feeding,
+    "switch_feeding_side": switch_feeding_side,
+    "complete_feeding": complete_feeding,
+    "cancel_feeding": cancel_feeding,
+    "get_feeding_history": get_feeding_history,
+    "log_diaper": log_diaper,
+    "log_diapers_batch": log_diapers_batch,
+    "get_diaper_history": get_diaper_history,
+    "log_growth": log_growth,
+    "get_latest_growth": get_latest_growth,
+    "get_growth_history": get_growth_history,
+}
+
+
+async def batch_execute(
+    calls: List[Dict[str, Any]],
+    max_concurrent: int = 5,
+    stop_on_error: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Execute several tool calls in one request.
+
+    Runs the given tool invocations concurrently (bounded by max_concurrent)
+    and returns one consolidated result list, so e.g. a diaper change, a
+    bottle feeding and a sleep entry can be logged in a single round trip.
+
+    Args:
+        calls: List of {"name": str, "arguments": dict} entries. "name" must be
+               one of the registered tool names (e.g. "log_diaper"); "arguments"
+               holds that tool's keyword arguments and may be omitted for tools
+               that take none.
+        max_concurrent: Maximum number of calls running at once (default 5)
+        stop_on_error: If True, the first failing call aborts the batch: its
+                       error is raised and calls that have not finished yet are
+                       cancelled (calls that already completed are not rolled
+                       back). If False (default), failures are recorded per-call
+                       and the remaining calls still run.
+
+    Returns:
+        List of dicts, one per call in input order, each containing:
+        - name (str): Tool name that was invoked
+        - success (bool): True if the call completed without error
+        - result: The tool's return value (present when success is True)
+        - error (str): Error message (present when success is False)
+
+    Raises:
+        ValueError: If calls is empty, a name is not a known tool, or
+                    max_concurrent is less than 1
+        Exception: When stop_on_error is True and a call fails
+    """
+    try:
+        if not calls:
+            raise ValueError("calls must be a non-empty list")
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+
+        for call in calls:
+            name = call.get("name")
+            if name not in DISPATCH:
+                raise ValueError(
+                    f"Unknown tool '{name}'. "
+                    f"Valid tools: {', '.join(sorted(DISPATCH))}"
+                )
+
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def run_one(call: Dict[str, Any]):
+            async with semaphore:
+                arguments = call.get("arguments") or {}
+                return await DISPATCH[call["name"]](**arguments)
+
+        tasks = [asyncio.create_task(run_one(call)) for call in calls]
+        try:
+            outcomes = await asyncio.gather(
+                *tasks, return_exceptions=not stop_on_error
+            )
+        except BaseException:
+            # stop_on_error: cancel the calls still queued or in flight
+            # before surfacing the first failure
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        results = []
+        for call, outcome in zip(calls, outcomes):
+            if isinstance(outcome, BaseException):
+                results.append({
+                    "name": call["name"],
+                    "success": False,
+                    "error": str(outcome),
+                })
+            else:
+                results.append({
+                    "name": call["name"],
+                    "success": True,
+                    "result": outcome,
+                })
+
+        return results
+
+    except ValueError:
+        raise
+    except Exception as e:
+        raise Exception(f"Failed to execute batch: {str(e)}")
+
+
+def register_batch_tools(mcp):
+    """Register batch execution tools with FastMCP instance."""
+    mcp.tool()(batch_execute)
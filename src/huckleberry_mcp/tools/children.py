@@ -1,9 +1,41 @@
 """Child management tools for Huckleberry MCP server."""
 
+import time
 from typing import Any, Dict, List, Optional
 from ..auth import get_authenticated_api
 
 
+# Children change rarely, so the uid -> child map is cached briefly to keep
+# every tool call from paying a network round trip just to validate a uid.
+_CHILDREN_CACHE_TTL_SECONDS = 300
+
+_children_cache: Dict[str, Dict[str, Any]] = {}
+_children_cache_expiry: float = 0.0
+
+
+async def _get_children_map() -> Dict[str, Dict[str, Any]]:
+    """Get a uid -> child record map, cached with a short TTL."""
+    global _children_cache, _children_cache_expiry
+
+    now = time.monotonic()
+    if now < _children_cache_expiry:
+        return _children_cache
+
+    api = await get_authenticated_api()
+    children = api.get_children()
+
+    _children_cache = {child.get("uid"): child for child in children}
+    _children_cache_expiry = now + _CHILDREN_CACHE_TTL_SECONDS
+    return _children_cache
+
+
+def invalidate_children_cache() -> None:
+    """Drop the cached children roster so the next lookup refetches it."""
+    global _children_cache, _children_cache_expiry
+    _children_cache = {}
+    _children_cache_expiry = 0.0
+
+
 async def list_children() -> List[Dict[str, Any]]:
     """
     List all child profiles registered in the Huckleberry account.
@@ -51,14 +83,10 @@ async def get_child_name(child_uid: str) -> Optional[str]:
         Exception: When API authentication fails or request errors
     """
     try:
-        api = await get_authenticated_api()
-        children = api.get_children()
+        children_map = await _get_children_map()
 
-        for child in children:
-            if child.get("uid") == child_uid:
-                return child.get("name")
-
-        return None
+        child = children_map.get(child_uid)
+        return child.get("name") if child else None
 
     except Exception as e:
         raise Exception(f"Failed to get child name: {str(e)}")
@@ -75,15 +103,12 @@ async def validate_child_uid(child_uid: str) -> bool:
         True if valid, raises exception otherwise
     """
     try:
-        api = await get_authenticated_api()
-        children = api.get_children()
+        children_map = await _get_children_map()
 
-        valid_uids = [child.get("uid") for child in children]
-
-        if child_uid not in valid_uids:
+        if child_uid not in children_map:
             raise ValueError(
                 f"Invalid child_uid '{child_uid}'. "
-                f"Valid UIDs: {', '.join(valid_uids)}"
+                f"Valid UIDs: {', '.join(children_map)}"
             )
 
         return True
@@ -94,6 +119,38 @@ async def validate_child_uid(child_uid: str) -> bool:
         raise Exception(f"Failed to validate child_uid: {str(e)}")
 
 
+async def resolve_child(child_uid: str):
+    """
+    Resolve a child_uid to the authenticated API and child record in one step.
+
+    Combines the auth lookup and (cached) roster fetch that every tool needs,
+    so callers don't pay for validate_child_uid and get_authenticated_api
+    separately.
+
+    Args:
+        child_uid: The child's unique identifier (from list_children)
+
+    Returns:
+        Tuple of (api, child) where api is the authenticated HuckleberryAPI
+        instance and child is the matching roster record dict
+
+    Raises:
+        ValueError: If child_uid is not a known child
+        Exception: When API authentication fails or request errors
+    """
+    api = await get_authenticated_api()
+    children_map = await _get_children_map()
+
+    child = children_map.get(child_uid)
+    if child is None:
+        raise ValueError(
+            f"Invalid child_uid '{child_uid}'. "
+            f"Valid UIDs: {', '.join(children_map)}"
+        )
+
+    return api, child
+
+
 def register_children_tools(mcp):
     """Register child management tools with FastMCP instance."""
     mcp.tool()(list_children)
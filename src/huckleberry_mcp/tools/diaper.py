@@ -1,14 +1,55 @@
 """Diaper tracking tools for Huckleberry MCP server."""
 
+import asyncio
 import time
-import uuid
+from secrets import token_hex
 from typing import Any, Dict, List, Optional
-from datetime import datetime, timezone, timedelta
-from ..auth import get_authenticated_api
-from .children import validate_child_uid
+from .children import resolve_child
 from ..utils import iso_to_timestamp, iso_datetime_to_timestamp, timestamp_to_local_iso
 
 
+# Valid values for diaper fields, hoisted to module scope so validation is
+# an O(1) membership test instead of a per-call list build and scan.
+_VALID_MODES = frozenset(("pee", "poo", "both", "dry"))
+_VALID_AMOUNTS = frozenset(("little", "medium", "big"))
+_VALID_COLORS = frozenset(("yellow", "brown", "black", "green", "red", "gray"))
+_VALID_CONSISTENCIES = frozenset(
+    ("solid", "loose", "runny", "mucousy", "hard", "pebbles", "diarrhea")
+)
+
+# Amount label -> backend quantity value
+_AMOUNT_MAP = {"little": 0.0, "medium": 50.0, "big": 100.0}
+
+# Fully-formatted error templates so failing validation only pays for the
+# final .format() call.
+_MODE_ERR = "Invalid mode '{}'. Must be one of: " + ", ".join(sorted(_VALID_MODES))
+_PEE_AMOUNT_ERR = "Invalid pee_amount '{}'. Must be one of: " + ", ".join(sorted(_VALID_AMOUNTS))
+_POO_AMOUNT_ERR = "Invalid poo_amount '{}'. Must be one of: " + ", ".join(sorted(_VALID_AMOUNTS))
+_COLOR_ERR = "Invalid color '{}'. Must be one of: " + ", ".join(sorted(_VALID_COLORS))
+_CONSISTENCY_ERR = "Invalid consistency '{}'. Must be one of: " + ", ".join(sorted(_VALID_CONSISTENCIES))
+
+# Firestore caps a WriteBatch at 500 mutations; stay well under it.
+_BATCH_CHUNK_SIZE = 250
+
+# Newest known prefs.lastDiaper.start per child this session, used to skip
+# prefs rewrites when retroactively logging events older than the latest one.
+_last_diaper_ts: Dict[str, float] = {}
+
+
+def _validate_diaper_fields(mode, pee_amount, poo_amount, color, consistency) -> None:
+    """Validate shared diaper field values, raising ValueError on bad input."""
+    if mode not in _VALID_MODES:
+        raise ValueError(_MODE_ERR.format(mode))
+    if pee_amount and pee_amount not in _VALID_AMOUNTS:
+        raise ValueError(_PEE_AMOUNT_ERR.format(pee_amount))
+    if poo_amount and poo_amount not in _VALID_AMOUNTS:
+        raise ValueError(_POO_AMOUNT_ERR.format(poo_amount))
+    if color and color not in _VALID_COLORS:
+        raise ValueError(_COLOR_ERR.format(color))
+    if consistency and consistency not in _VALID_CONSISTENCIES:
+        raise ValueError(_CONSISTENCY_ERR.format(consistency))
+
+
 async def log_diaper(
     child_uid: str,
     mode: str = "both",
@@ -42,49 +83,16 @@ async def log_diaper(
         - color (str | None): Color if provided, None otherwise
         - consistency (str | None): Consistency if provided, None otherwise
         - timestamp (str): Logged time in local ISO format
+        - epoch (float): Logged time as a Unix timestamp in seconds
 
     Raises:
         ValueError: If mode, color, consistency, or amount values are invalid
         Exception: When API fails
     """
     try:
-        await validate_child_uid(child_uid)
-
-        # Validate mode
-        valid_modes = ["pee", "poo", "both", "dry"]
-        if mode not in valid_modes:
-            raise ValueError(
-                f"Invalid mode '{mode}'. Must be one of: {', '.join(valid_modes)}"
-            )
-
-        # Validate amounts if provided
-        valid_amounts = ["little", "medium", "big"]
-        if pee_amount and pee_amount not in valid_amounts:
-            raise ValueError(
-                f"Invalid pee_amount '{pee_amount}'. Must be one of: {', '.join(valid_amounts)}"
-            )
-        if poo_amount and poo_amount not in valid_amounts:
-            raise ValueError(
-                f"Invalid poo_amount '{poo_amount}'. Must be one of: {', '.join(valid_amounts)}"
-            )
-
-        # Validate color if provided
-        if color:
-            valid_colors = ["yellow", "brown", "black", "green", "red", "gray"]
-            if color not in valid_colors:
-                raise ValueError(
-                    f"Invalid color '{color}'. Must be one of: {', '.join(valid_colors)}"
-                )
+        api, _ = await resolve_child(child_uid)
 
-        # Validate consistency if provided
-        if consistency:
-            valid_consistencies = ["solid", "loose", "runny", "mucousy", "hard", "pebbles", "diarrhea"]
-            if consistency not in valid_consistencies:
-                raise ValueError(
-                    f"Invalid consistency '{consistency}'. Must be one of: {', '.join(valid_consistencies)}"
-                )
-
-        api = await get_authenticated_api()
+        _validate_diaper_fields(mode, pee_amount, poo_amount, color, consistency)
 
         # Determine timestamp to use
         if timestamp:
@@ -93,29 +101,31 @@ async def log_diaper(
         else:
             change_time = time.time()
 
+        # Compute the timezone offset once; it is reused in both documents
+        offset_minutes = api._get_timezone_offset_minutes()
+
         # Access Firestore client directly for custom timestamp support
         client = api._get_firestore_client()
         diaper_ref = client.collection("diaper").document(child_uid)
 
         # Create interval ID (timestamp in ms + random suffix)
         interval_timestamp_ms = int(change_time * 1000)
-        interval_id = f"{interval_timestamp_ms}-{uuid.uuid4().hex[:20]}"
+        interval_id = f"{interval_timestamp_ms}-{token_hex(10)}"
 
         # Build interval data (matching app behavior)
         interval_data = {
             "start": change_time,
             "lastUpdated": change_time,
             "mode": mode,
-            "offset": api._get_timezone_offset_minutes(),
+            "offset": offset_minutes,
         }
 
-        # Add quantity field if amounts are specified
-        amount_map = {"little": 0.0, "medium": 50.0, "big": 100.0}
-        quantity = {}
-        if pee_amount and pee_amount in amount_map:
-            quantity["pee"] = amount_map[pee_amount]
-        if poo_amount and poo_amount in amount_map:
-            quantity["poo"] = amount_map[poo_amount]
+        # Add quantity field only when amounts are specified
+        quantity = {
+            field: _AMOUNT_MAP[amount]
+            for field, amount in (("pee", pee_amount), ("poo", poo_amount))
+            if amount
+        }
         if quantity:
             interval_data["quantity"] = quantity
 
@@ -129,20 +139,32 @@ async def log_diaper(
         if notes:
             interval_data["notes"] = notes
 
-        # Create interval document in subcollection
-        diaper_ref.collection("intervals").document(interval_id).set(interval_data)
+        # Write the interval and the prefs.lastDiaper update as one atomic
+        # batch so the pair costs a single Firestore round trip. The prefs
+        # rewrite is skipped for retroactive events older than the newest
+        # change already recorded this session.
+        batch = client.batch()
+        batch.set(diaper_ref.collection("intervals").document(interval_id), interval_data)
+
+        if change_time >= _last_diaper_ts.get(child_uid, float("-inf")):
+            last_diaper_data = {
+                "start": change_time,
+                "mode": mode,
+                "offset": offset_minutes,
+            }
+            batch.update(diaper_ref, {
+                "prefs.lastDiaper": last_diaper_data,
+                "prefs.timestamp": {"seconds": change_time},
+                "prefs.local_timestamp": change_time,
+            })
 
-        # Update prefs.lastDiaper
-        last_diaper_data = {
-            "start": change_time,
-            "mode": mode,
-            "offset": api._get_timezone_offset_minutes(),
-        }
-        diaper_ref.update({
-            "prefs.lastDiaper": last_diaper_data,
-            "prefs.timestamp": {"seconds": change_time},
-            "prefs.local_timestamp": change_time,
-        })
+        # The Firestore SDK is blocking; run the commit in a worker thread so
+        # the event loop keeps serving other tool calls
+        await asyncio.to_thread(batch.commit)
+
+        _last_diaper_ts[child_uid] = max(
+            change_time, _last_diaper_ts.get(child_uid, change_time)
+        )
 
         message_parts = [f"Logged diaper change ({mode})"]
         if color:
@@ -159,15 +181,144 @@ async def log_diaper(
             "mode": mode,
             "color": color,
             "consistency": consistency,
-            "timestamp": timestamp_to_local_iso(change_time, user_timezone)
+            "timestamp": timestamp_to_local_iso(change_time, user_timezone),
+            "epoch": change_time
         }
 
-    except ValueError as e:
+    except ValueError:
         raise
     except Exception as e:
         raise Exception(f"Failed to log diaper change: {str(e)}")
 
 
+async def log_diapers_batch(
+    child_uid: str,
+    entries: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Log many diaper changes in one call.
+
+    Designed for bulk retroactive imports. Every entry is validated up
+    front, then the interval documents are written in Firestore batches of
+    up to 250 entries which are committed concurrently.
+
+    Args:
+        child_uid: The child's unique identifier (from list_children)
+        entries: List of dicts, each accepting the same optional fields as
+                 log_diaper: mode (default "both"), pee_amount, poo_amount,
+                 color, consistency, diaper_rash, notes, timestamp
+
+    Returns:
+        Dict with keys:
+        - success (bool): True if all entries were logged
+        - message (str): Human-readable confirmation
+        - count (int): Number of diaper changes written
+        - batches (int): Number of Firestore batch commits issued
+
+    Raises:
+        ValueError: If entries is empty or any entry has invalid field values
+                    (no writes are issued in that case)
+        Exception: When API fails
+    """
+    try:
+        api, _ = await resolve_child(child_uid)
+
+        if not entries:
+            raise ValueError("entries must be a non-empty list")
+
+        user_timezone = api._timezone
+        offset_minutes = api._get_timezone_offset_minutes()
+        current_time = time.time()
+
+        # Validate everything and build the interval documents before any
+        # write goes out, so a bad entry can't leave a partial import
+        docs = []
+        for entry in entries:
+            mode = entry.get("mode", "both")
+            pee_amount = entry.get("pee_amount")
+            poo_amount = entry.get("poo_amount")
+            color = entry.get("color")
+            consistency = entry.get("consistency")
+            _validate_diaper_fields(mode, pee_amount, poo_amount, color, consistency)
+
+            if entry.get("timestamp"):
+                change_time = iso_datetime_to_timestamp(entry["timestamp"], user_timezone)
+            else:
+                change_time = current_time
+
+            interval_data = {
+                "start": change_time,
+                "lastUpdated": change_time,
+                "mode": mode,
+                "offset": offset_minutes,
+            }
+
+            quantity = {
+                field: _AMOUNT_MAP[amount]
+                for field, amount in (("pee", pee_amount), ("poo", poo_amount))
+                if amount
+            }
+            if quantity:
+                interval_data["quantity"] = quantity
+
+            if color:
+                interval_data["color"] = color
+            if consistency:
+                interval_data["consistency"] = consistency
+            if entry.get("diaper_rash"):
+                interval_data["diaperRash"] = True
+            if entry.get("notes"):
+                interval_data["notes"] = entry["notes"]
+
+            interval_id = f"{int(change_time * 1000)}-{token_hex(10)}"
+            docs.append((interval_id, interval_data))
+
+        client = api._get_firestore_client()
+        diaper_ref = client.collection("diaper").document(child_uid)
+        intervals_ref = diaper_ref.collection("intervals")
+
+        # Chunk the writes into WriteBatches under the Firestore limit
+        batches = []
+        for i in range(0, len(docs), _BATCH_CHUNK_SIZE):
+            batch = client.batch()
+            for interval_id, interval_data in docs[i:i + _BATCH_CHUNK_SIZE]:
+                batch.set(intervals_ref.document(interval_id), interval_data)
+            batches.append(batch)
+
+        # Point prefs.lastDiaper at the newest entry in the import, unless a
+        # newer change was already logged this session
+        newest = max(docs, key=lambda doc: doc[1]["start"])[1]
+        if newest["start"] >= _last_diaper_ts.get(child_uid, float("-inf")):
+            batches[-1].update(diaper_ref, {
+                "prefs.lastDiaper": {
+                    "start": newest["start"],
+                    "mode": newest["mode"],
+                    "offset": offset_minutes,
+                },
+                "prefs.timestamp": {"seconds": current_time},
+                "prefs.local_timestamp": current_time,
+            })
+
+        # Commit the batches concurrently off the event loop
+        await asyncio.gather(*(asyncio.to_thread(batch.commit) for batch in batches))
+
+        _last_diaper_ts[child_uid] = max(
+            newest["start"], _last_diaper_ts.get(child_uid, newest["start"])
+        )
+
+        return {
+            "success": True,
+            "message": f"Logged {len(docs)} diaper changes for child {child_uid}",
+            "count": len(docs),
+            "batches": len(batches),
+        }
+
+    except ValueError:
+        raise
+    except Exception as e:
+        raise Exception(f"Failed to log diaper batch: {str(e)}")
+
+
 async def get_diaper_history(
     child_uid: str,
     start_date: Optional[str] = None,
@@ -193,40 +344,40 @@ async def get_diaper_history(
         Exception: When API fails
     """
     try:
-        await validate_child_uid(child_uid)
-        api = await get_authenticated_api()
+        api, _ = await resolve_child(child_uid)
 
         # Get user's timezone for proper date interpretation
         user_timezone = api._timezone
 
-        # Default to last 7 days if no dates provided
+        # Default to last 7 days if no dates provided, reading the clock once
+        now_timestamp = int(time.time())
         if not start_date:
-            start_timestamp = int((datetime.now(timezone.utc) - timedelta(days=7)).timestamp())
+            start_timestamp = now_timestamp - 7 * 86400
         else:
             start_timestamp = iso_to_timestamp(start_date, user_timezone)
 
         if not end_date:
-            end_timestamp = int(datetime.now(timezone.utc).timestamp())
+            end_timestamp = now_timestamp
         else:
             end_timestamp = iso_to_timestamp(end_date, user_timezone)
 
-        # Use get_diaper_intervals
-        intervals = api.get_diaper_intervals(child_uid, start_timestamp, end_timestamp)
+        # Use get_diaper_intervals; run the blocking fetch off the event loop
+        intervals = await asyncio.to_thread(
+            api.get_diaper_intervals, child_uid, start_timestamp, end_timestamp
+        )
 
-        result = []
-        for interval in intervals:
-            # Convert timestamp to ISO format in user's timezone
-            timestamp = timestamp_to_local_iso(interval["start"], user_timezone)
-
-            result.append({
-                "timestamp": timestamp,
+        # Build each row in a single comprehension pass; timestamps are
+        # converted to ISO format in the user's timezone
+        return [
+            {
+                "timestamp": timestamp_to_local_iso(interval["start"], user_timezone),
                 "mode": interval.get("mode"),
                 "color": interval.get("color"),
                 "consistency": interval.get("consistency"),
                 "notes": interval.get("notes"),
-            })
-
-        return result
+            }
+            for interval in intervals
+        ]
 
     except Exception as e:
         raise Exception(f"Failed to get diaper history: {str(e)}")
@@ -235,4 +386,5 @@ async def get_diaper_history(
 def register_diaper_tools(mcp):
     """Register diaper tracking tools with FastMCP instance."""
     mcp.tool()(log_diaper)
+    mcp.tool()(log_diapers_batch)
     mcp.tool()(get_diaper_history)
@@ -15,14 +15,39 @@ Valid operations by state:
 Only one feeding session can be active per child at a time.
 """
 
+import asyncio
 import time
-import uuid
+from secrets import token_hex
 from typing import Any, Dict, List, Optional
-from datetime import datetime, timezone, timedelta
-from ..auth import get_authenticated_api
-from .children import validate_child_uid
+from .children import resolve_child
 from ..utils import iso_to_timestamp, iso_datetime_to_timestamp, timestamp_to_local_iso
 
+# Valid values for feeding fields, checked on every log call
+_VALID_BOTTLE_TYPES = frozenset(("Formula", "Breast Milk", "Mixed"))
+_VALID_UNITS = frozenset(("oz", "ml"))
+_VALID_SIDES = frozenset(("left", "right"))
+
+# Error templates built once so per-call failures only pay for format()
+_BOTTLE_TYPE_ERR = "Invalid bottle_type '{}'. Must be one of: Formula, Breast Milk, Mixed"
+_UNITS_ERR = "Invalid units '{}'. Must be one of: oz, ml"
+
+# Interval fields replicated into the prefs.last* summaries
+_LAST_BOTTLE_KEYS = ("mode", "start", "amount", "units", "bottleType", "offset")
+_LAST_NURSING_KEYS = ("mode", "start", "leftDuration", "rightDuration", "offset")
+
+# Firestore caps a WriteBatch at 500 mutations; stay well under it.
+_BATCH_CHUNK_SIZE = 250
+
+# Newest known prefs.lastBottle/lastNursing start per child this session,
+# used to skip prefs rewrites when retroactively logging feedings older
+# than the latest one.
+_last_bottle_ts: Dict[str, float] = {}
+_last_nursing_ts: Dict[str, float] = {}
+
+# Before the session marker is populated, an explicit timestamp older than
+# this is treated as retroactive.
+_RETROACTIVE_SKEW_SECONDS = 300
+
 
 async def log_bottle_feeding(
     child_uid: str,
@@ -37,6 +62,11 @@ async def log_bottle_feeding(
     Records a bottle feeding with the specified amount and content type. Supports
     retroactive logging by providing an optional timestamp.
 
+    Retroactive entries do not move the "last feeding" pointer backwards: the
+    prefs.lastBottle update is skipped when the entry is older than the newest
+    bottle feeding logged this session, or — before any has been — when the
+    provided timestamp is more than five minutes in the past.
+
     Args:
         child_uid: The child's unique identifier (from list_children)
         amount: Amount fed (in the specified units)
@@ -60,18 +90,15 @@ async def log_bottle_feeding(
         Exception: When API fails
     """
     try:
-        await validate_child_uid(child_uid)
-        api = await get_authenticated_api()
+        api, _ = await resolve_child(child_uid)
 
         # Validate bottle_type
-        valid_types = ["Formula", "Breast Milk", "Mixed"]
-        if bottle_type not in valid_types:
-            raise ValueError(f"Invalid bottle_type '{bottle_type}'. Must be one of: {', '.join(valid_types)}")
+        if bottle_type not in _VALID_BOTTLE_TYPES:
+            raise ValueError(_BOTTLE_TYPE_ERR.format(bottle_type))
 
         # Validate units
-        valid_units = ["oz", "ml"]
-        if units not in valid_units:
-            raise ValueError(f"Invalid units '{units}'. Must be one of: {', '.join(valid_units)}")
+        if units not in _VALID_UNITS:
+            raise ValueError(_UNITS_ERR.format(units))
 
         # Validate amount
         if amount <= 0:
@@ -80,7 +107,7 @@ async def log_bottle_feeding(
         # Get user's timezone
         user_timezone = api._timezone
 
-        # Determine feeding timestamp
+        # Determine feeding timestamp; read the clock once
         current_time = time.time()
         if timestamp is not None:
             feed_timestamp = iso_datetime_to_timestamp(timestamp, user_timezone)
@@ -91,8 +118,12 @@ async def log_bottle_feeding(
         client = api._get_firestore_client()
         feed_ref = client.collection("feed").document(child_uid)
 
-        # Generate interval ID (format: timestamp-random, matching complete_feeding)
-        interval_id = f"{int(current_time * 1000)}-{uuid.uuid4().hex[:20]}"
+        # Generate interval ID prefixed with the event time in ms, matching
+        # the diaper tools and the bulk import path
+        interval_id = f"{int(feed_timestamp * 1000)}-{token_hex(10)}"
+
+        # Compute the timezone offset once for all fields below
+        offset_minutes = api._get_timezone_offset_minutes()
 
         # Create interval document for bottle feeding
         interval_data = {
@@ -102,28 +133,42 @@ async def log_bottle_feeding(
             "units": units,
             "bottleType": bottle_type,
             "lastUpdated": current_time,
-            "offset": api._get_timezone_offset_minutes(),
-            "end_offset": api._get_timezone_offset_minutes(),
+            "offset": offset_minutes,
+            "end_offset": offset_minutes,
         }
 
-        # Write to intervals subcollection
-        feed_ref.collection("intervals").document(interval_id).set(interval_data)
+        # Write the interval and the prefs update in one batched round trip.
+        # The prefs.lastBottle rewrite is skipped for retroactive feedings
+        # older than the newest one already recorded this session, so old
+        # imports don't move the "last feeding" pointer backwards.
+        batch = client.batch()
+        batch.set(feed_ref.collection("intervals").document(interval_id), interval_data)
 
-        # Update prefs.lastBottle (matching pattern from other feeding types)
-        last_bottle_data = {
-            "mode": "bottle",
-            "start": feed_timestamp,
-            "amount": amount,
-            "units": units,
-            "bottleType": bottle_type,
-            "offset": api._get_timezone_offset_minutes(),
-        }
+        last_known = _last_bottle_ts.get(child_uid)
+        if last_known is not None:
+            update_prefs = feed_timestamp >= last_known
+        else:
+            # Fresh session: fall back to a wall-clock check so an explicit
+            # timestamp well in the past still can't regress the pointer
+            update_prefs = (
+                timestamp is None
+                or current_time - feed_timestamp <= _RETROACTIVE_SKEW_SECONDS
+            )
+
+        if update_prefs:
+            # prefs.lastBottle fields are a subset of the interval document
+            last_bottle_data = {k: interval_data[k] for k in _LAST_BOTTLE_KEYS}
+            batch.update(feed_ref, {
+                "prefs.lastBottle": last_bottle_data,
+                "prefs.timestamp": {"seconds": current_time},
+                "prefs.local_timestamp": current_time,
+            })
 
-        feed_ref.update({
-            "prefs.lastBottle": last_bottle_data,
-            "prefs.timestamp": {"seconds": current_time},
-            "prefs.local_timestamp": current_time,
-        })
+        await asyncio.to_thread(batch.commit)
+
+        _last_bottle_ts[child_uid] = max(
+            feed_timestamp, _last_bottle_ts.get(child_uid, feed_timestamp)
+        )
 
         return {
             "success": True,
@@ -135,12 +180,127 @@ async def log_bottle_feeding(
             "interval_id": interval_id
         }
 
-    except ValueError as e:
+    except ValueError:
         raise
     except Exception as e:
         raise Exception(f"Failed to log bottle feeding: {str(e)}")
 
 
+async def log_bottle_feedings(
+    child_uid: str,
+    entries: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Log many bottle feedings in one call.
+
+    Designed for bulk retroactive imports. Every entry is validated up
+    front, then the interval documents are written in Firestore batches of
+    up to 250 entries which are committed concurrently.
+
+    Args:
+        child_uid: The child's unique identifier (from list_children)
+        entries: List of dicts, each accepting the same fields as
+                 log_bottle_feeding: amount (required), bottle_type
+                 (default "Formula"), units (default "oz"), timestamp
+
+    Returns:
+        Dict with keys:
+        - success (bool): True if all entries were logged
+        - message (str): Human-readable confirmation
+        - count (int): Number of feedings written
+        - batches (int): Number of Firestore batch commits issued
+
+    Raises:
+        ValueError: If entries is empty or any entry has invalid field values
+                    (no writes are issued in that case)
+        Exception: When API fails
+    """
+    try:
+        api, _ = await resolve_child(child_uid)
+
+        if not entries:
+            raise ValueError("entries must be a non-empty list")
+
+        user_timezone = api._timezone
+        offset_minutes = api._get_timezone_offset_minutes()
+        current_time = time.time()
+
+        # Validate everything and build the interval documents before any
+        # write goes out, so a bad entry can't leave a partial import
+        docs = []
+        for entry in entries:
+            amount = entry.get("amount")
+            bottle_type = entry.get("bottle_type", "Formula")
+            units = entry.get("units", "oz")
+
+            if bottle_type not in _VALID_BOTTLE_TYPES:
+                raise ValueError(_BOTTLE_TYPE_ERR.format(bottle_type))
+            if units not in _VALID_UNITS:
+                raise ValueError(_UNITS_ERR.format(units))
+            if amount is None or amount <= 0:
+                raise ValueError("Amount must be a positive number")
+
+            if entry.get("timestamp"):
+                feed_timestamp = iso_datetime_to_timestamp(entry["timestamp"], user_timezone)
+            else:
+                feed_timestamp = current_time
+
+            interval_data = {
+                "mode": "bottle",
+                "start": feed_timestamp,
+                "amount": amount,
+                "units": units,
+                "bottleType": bottle_type,
+                "lastUpdated": current_time,
+                "offset": offset_minutes,
+                "end_offset": offset_minutes,
+            }
+
+            interval_id = f"{int(feed_timestamp * 1000)}-{token_hex(10)}"
+            docs.append((interval_id, interval_data))
+
+        client = api._get_firestore_client()
+        feed_ref = client.collection("feed").document(child_uid)
+        intervals_ref = feed_ref.collection("intervals")
+
+        # Chunk the writes into WriteBatches under the Firestore limit
+        batches = []
+        for i in range(0, len(docs), _BATCH_CHUNK_SIZE):
+            batch = client.batch()
+            for interval_id, interval_data in docs[i:i + _BATCH_CHUNK_SIZE]:
+                batch.set(intervals_ref.document(interval_id), interval_data)
+            batches.append(batch)
+
+        # Point prefs.lastBottle at the newest entry in the import, unless a
+        # newer feeding was already logged this session
+        newest = max(docs, key=lambda doc: doc[1]["start"])[1]
+        if newest["start"] >= _last_bottle_ts.get(child_uid, float("-inf")):
+            batches[-1].update(feed_ref, {
+                "prefs.lastBottle": {k: newest[k] for k in _LAST_BOTTLE_KEYS},
+                "prefs.timestamp": {"seconds": current_time},
+                "prefs.local_timestamp": current_time,
+            })
+
+        # Commit the batches concurrently off the event loop
+        await asyncio.gather(*(asyncio.to_thread(batch.commit) for batch in batches))
+
+        _last_bottle_ts[child_uid] = max(
+            newest["start"], _last_bottle_ts.get(child_uid, newest["start"])
+        )
+
+        return {
+            "success": True,
+            "message": f"Logged {len(docs)} bottle feedings for child {child_uid}",
+            "count": len(docs),
+            "batches": len(batches),
+        }
+
+    except ValueError:
+        raise
+    except Exception as e:
+        raise Exception(f"Failed to log bottle feeding batch: {str(e)}")
+
+
 async def log_breastfeeding(
     child_uid: str,
     start_time: str,
@@ -155,6 +315,11 @@ async def log_breastfeeding(
     Useful for retroactive logging or importing past feeding data. Does not
     require an active timer session.
 
+    The "last feeding" pointer is session-scoped: prefs.lastNursing is only
+    updated when this entry is at least as new as the newest breastfeeding
+    logged since the server started, so older retroactive entries leave it
+    untouched. The first entry after a restart always updates it.
+
     Args:
         child_uid: The child's unique identifier (from list_children)
         start_time: Feeding start time in ISO format (e.g., "2026-01-30T14:30:00" or "2026-01-30T14:30:00Z")
@@ -179,13 +344,20 @@ async def log_breastfeeding(
         Exception: When API fails
     """
     try:
-        await validate_child_uid(child_uid)
-        api = await get_authenticated_api()
-
-        # Validate side if provided
-        if last_side and last_side not in ["left", "right"]:
+        # Reject bad argument combinations before any awaited round trip
+        if last_side and last_side not in _VALID_SIDES:
             raise ValueError("Invalid last_side. Must be 'left' or 'right'")
 
+        if end_time is not None:
+            if left_duration_minutes is not None or right_duration_minutes is not None:
+                raise ValueError("When using end_time, do not specify left_duration_minutes or right_duration_minutes")
+            if last_side is None:
+                raise ValueError("When using end_time, last_side is required to determine which breast to assign duration to")
+        elif left_duration_minutes is None and right_duration_minutes is None:
+            raise ValueError("Must provide either end_time OR at least one of left_duration_minutes/right_duration_minutes")
+
+        api, _ = await resolve_child(child_uid)
+
         # Get user's timezone
         user_timezone = api._timezone
 
@@ -195,12 +367,6 @@ async def log_breastfeeding(
         # Determine durations
         if end_time is not None:
             # Calculate total duration from end_time
-            if left_duration_minutes is not None or right_duration_minutes is not None:
-                raise ValueError("When using end_time, do not specify left_duration_minutes or right_duration_minutes")
-
-            if last_side is None:
-                raise ValueError("When using end_time, last_side is required to determine which breast to assign duration to")
-
             end_timestamp = iso_datetime_to_timestamp(end_time, user_timezone)
             total_duration_sec = end_timestamp - start_timestamp
 
@@ -218,9 +384,6 @@ async def log_breastfeeding(
                 right_duration = total_duration_min
         else:
             # Use provided durations
-            if left_duration_minutes is None and right_duration_minutes is None:
-                raise ValueError("Must provide either end_time OR at least one of left_duration_minutes/right_duration_minutes")
-
             left_duration = float(left_duration_minutes) if left_duration_minutes is not None else 0.0
             right_duration = float(right_duration_minutes) if right_duration_minutes is not None else 0.0
 
@@ -233,9 +396,14 @@ async def log_breastfeeding(
         client = api._get_firestore_client()
         feed_ref = client.collection("feed").document(child_uid)
 
-        # Generate interval ID (format: timestamp-random, matching complete_feeding)
-        current_time = time.time()
-        interval_id = f"{int(current_time * 1000)}-{uuid.uuid4().hex[:20]}"
+        # Generate interval ID (format: timestamp-random, matching
+        # complete_feeding); read the clock once as integer nanoseconds
+        current_ns = time.time_ns()
+        current_time = current_ns / 1e9
+        interval_id = f"{current_ns // 1_000_000}-{token_hex(10)}"
+
+        # Compute the timezone offset once for all fields below
+        offset_minutes = api._get_timezone_offset_minutes()
 
         # Create interval document (matching complete_feeding structure)
         interval_data = {
@@ -245,36 +413,42 @@ async def log_breastfeeding(
             "lastUpdated": current_time,
             "leftDuration": left_duration,
             "rightDuration": right_duration,
-            "offset": api._get_timezone_offset_minutes(),
-            "end_offset": api._get_timezone_offset_minutes(),
+            "offset": offset_minutes,
+            "end_offset": offset_minutes,
         }
 
-        # Write to intervals subcollection
-        feed_ref.collection("intervals").document(interval_id).set(interval_data)
-
-        # Update prefs.lastNursing and prefs.lastSide (matching complete_feeding behavior)
+        # Update prefs.lastNursing and prefs.lastSide (matching complete_feeding
+        # behavior); lastNursing is the interval subset plus the combined duration
         total_duration = left_duration + right_duration
 
-        last_nursing_data = {
-            "mode": "breast",
-            "start": start_timestamp,
-            "duration": total_duration,
-            "leftDuration": left_duration,
-            "rightDuration": right_duration,
-            "offset": api._get_timezone_offset_minutes(),
-        }
+        last_nursing_data = {k: interval_data[k] for k in _LAST_NURSING_KEYS}
+        last_nursing_data["duration"] = total_duration
 
         last_side_data = {
             "start": start_timestamp,
             "lastSide": last_side,
         }
 
-        feed_ref.update({
-            "prefs.lastNursing": last_nursing_data,
-            "prefs.lastSide": last_side_data,
-            "prefs.timestamp": {"seconds": current_time},
-            "prefs.local_timestamp": current_time,
-        })
+        # Write the interval and the prefs update in one batched round trip.
+        # The prefs.lastNursing rewrite is skipped for retroactive feedings
+        # older than the newest one already recorded this session, so old
+        # imports don't move the "last feeding" pointer backwards.
+        batch = client.batch()
+        batch.set(feed_ref.collection("intervals").document(interval_id), interval_data)
+
+        if start_timestamp >= _last_nursing_ts.get(child_uid, float("-inf")):
+            batch.update(feed_ref, {
+                "prefs.lastNursing": last_nursing_data,
+                "prefs.lastSide": last_side_data,
+                "prefs.timestamp": {"seconds": current_time},
+                "prefs.local_timestamp": current_time,
+            })
+
+        await asyncio.to_thread(batch.commit)
+
+        _last_nursing_ts[child_uid] = max(
+            start_timestamp, _last_nursing_ts.get(child_uid, start_timestamp)
+        )
 
         return {
             "success": True,
@@ -287,7 +461,7 @@ async def log_breastfeeding(
             "interval_id": interval_id
         }
 
-    except ValueError as e:
+    except ValueError:
         raise
     except Exception as e:
         raise Exception(f"Failed to log breastfeeding: {str(e)}")
@@ -316,26 +490,30 @@ async def start_breastfeeding(child_uid: str, side: str) -> Dict[str, Any]:
         Exception: If a feeding session is already active for this child, or API fails
     """
     try:
-        await validate_child_uid(child_uid)
+        api, _ = await resolve_child(child_uid)
 
-        if side.lower() not in ["left", "right"]:
+        # Normalize once; the value is reused in the API call and response
+        side_lc = side.lower()
+        if side_lc not in _VALID_SIDES:
             raise ValueError(
                 f"Invalid side '{side}'. Must be 'left' or 'right'."
             )
 
-        api = await get_authenticated_api()
+        # Snapshot the clock before the RPC so the reported timestamp
+        # reflects when the operation was initiated
+        now = time.time()
 
         # Start feeding timer
-        api.start_feeding(child_uid, side=side.lower())
+        api.start_feeding(child_uid, side=side_lc)
 
         return {
             "success": True,
             "message": f"Breastfeeding started on {side} side for child {child_uid}",
-            "side": side.lower(),
-            "timestamp": timestamp_to_local_iso(time.time(), api._timezone)
+            "side": side_lc,
+            "timestamp": timestamp_to_local_iso(now, api._timezone)
         }
 
-    except ValueError as e:
+    except ValueError:
         raise
     except Exception as e:
         raise Exception(f"Failed to start breastfeeding session: {str(e)}")
@@ -363,8 +541,11 @@ async def pause_feeding(child_uid: str) -> Dict[str, Any]:
         A feeding session must be active and running (started via start_breastfeeding, not paused).
     """
     try:
-        await validate_child_uid(child_uid)
-        api = await get_authenticated_api()
+        api, _ = await resolve_child(child_uid)
+
+        # Snapshot the clock before the RPC so the reported timestamp
+        # reflects when the operation was initiated
+        now = time.time()
 
         # Pause feeding timer
         api.pause_feeding(child_uid)
@@ -372,10 +553,10 @@ async def pause_feeding(child_uid: str) -> Dict[str, Any]:
         return {
             "success": True,
             "message": f"Feeding tracking paused for child {child_uid}",
-            "timestamp": timestamp_to_local_iso(time.time(), api._timezone)
+            "timestamp": timestamp_to_local_iso(now, api._timezone)
         }
 
-    except ValueError as e:
+    except ValueError:
         raise
     except Exception as e:
         raise Exception(f"Failed to pause feeding session: {str(e)}")
@@ -403,8 +584,11 @@ async def resume_feeding(child_uid: str) -> Dict[str, Any]:
         A feeding session must be paused (via pause_feeding).
     """
     try:
-        await validate_child_uid(child_uid)
-        api = await get_authenticated_api()
+        api, _ = await resolve_child(child_uid)
+
+        # Snapshot the clock before the RPC so the reported timestamp
+        # reflects when the operation was initiated
+        now = time.time()
 
         # Resume feeding timer
         api.resume_feeding(child_uid)
@@ -412,10 +596,10 @@ async def resume_feeding(child_uid: str) -> Dict[str, Any]:
         return {
             "success": True,
             "message": f"Feeding tracking resumed for child {child_uid}",
-            "timestamp": timestamp_to_local_iso(time.time(), api._timezone)
+            "timestamp": timestamp_to_local_iso(now, api._timezone)
         }
 
-    except ValueError as e:
+    except ValueError:
         raise
     except Exception as e:
         raise Exception(f"Failed to resume feeding session: {str(e)}")
@@ -446,8 +630,11 @@ async def switch_feeding_side(child_uid: str) -> Dict[str, Any]:
         A feeding session must be active (running or paused).
     """
     try:
-        await validate_child_uid(child_uid)
-        api = await get_authenticated_api()
+        api, _ = await resolve_child(child_uid)
+
+        # Snapshot the clock before the RPC so the reported timestamp
+        # reflects when the operation was initiated
+        now = time.time()
 
         # Switch feeding side
         api.switch_feeding_side(child_uid)
@@ -455,10 +642,10 @@ async def switch_feeding_side(child_uid: str) -> Dict[str, Any]:
         return {
             "success": True,
             "message": "Switched feeding side",
-            "timestamp": timestamp_to_local_iso(time.time(), api._timezone)
+            "timestamp": timestamp_to_local_iso(now, api._timezone)
         }
 
-    except ValueError as e:
+    except ValueError:
         raise
     except Exception as e:
         raise Exception(f"Failed to switch feeding side: {str(e)}")
@@ -488,8 +675,11 @@ async def complete_feeding(child_uid: str) -> Dict[str, Any]:
         A feeding session must be active (running or paused).
     """
     try:
-        await validate_child_uid(child_uid)
-        api = await get_authenticated_api()
+        api, _ = await resolve_child(child_uid)
+
+        # Snapshot the clock before the RPC so the reported timestamp
+        # reflects when the operation was initiated
+        now = time.time()
 
         # Complete feeding timer
         api.complete_feeding(child_uid)
@@ -497,10 +687,10 @@ async def complete_feeding(child_uid: str) -> Dict[str, Any]:
         return {
             "success": True,
             "message": f"Feeding tracking completed and saved for child {child_uid}",
-            "timestamp": timestamp_to_local_iso(time.time(), api._timezone)
+            "timestamp": timestamp_to_local_iso(now, api._timezone)
         }
 
-    except ValueError as e:
+    except ValueError:
         raise
     except Exception as e:
         raise Exception(f"Failed to complete feeding session: {str(e)}")
@@ -530,8 +720,11 @@ async def cancel_feeding(child_uid: str) -> Dict[str, Any]:
         A feeding session must be active (running or paused).
     """
     try:
-        await validate_child_uid(child_uid)
-        api = await get_authenticated_api()
+        api, _ = await resolve_child(child_uid)
+
+        # Snapshot the clock before the RPC so the reported timestamp
+        # reflects when the operation was initiated
+        now = time.time()
 
         # Cancel feeding timer
         api.cancel_feeding(child_uid)
@@ -539,10 +732,10 @@ async def cancel_feeding(child_uid: str) -> Dict[str, Any]:
         return {
             "success": True,
             "message": f"Feeding tracking cancelled for child {child_uid}",
-            "timestamp": timestamp_to_local_iso(time.time(), api._timezone)
+            "timestamp": timestamp_to_local_iso(now, api._timezone)
         }
 
-    except ValueError as e:
+    except ValueError:
         raise
     except Exception as e:
         raise Exception(f"Failed to cancel feeding session: {str(e)}")
@@ -573,43 +766,44 @@ async def get_feeding_history(
         Exception: When API fails
     """
     try:
-        await validate_child_uid(child_uid)
-        api = await get_authenticated_api()
+        api, _ = await resolve_child(child_uid)
 
         # Get user's timezone for proper date interpretation
         user_timezone = api._timezone
 
-        # Default to last 7 days if no dates provided
+        # Default to last 7 days if no dates provided, reading the clock once
+        now_timestamp = int(time.time())
         if not start_date:
-            start_timestamp = int((datetime.now(timezone.utc) - timedelta(days=7)).timestamp())
+            start_timestamp = now_timestamp - 7 * 86400
         else:
             start_timestamp = iso_to_timestamp(start_date, user_timezone)
 
         if not end_date:
-            end_timestamp = int(datetime.now(timezone.utc).timestamp())
+            end_timestamp = now_timestamp
         else:
             end_timestamp = iso_to_timestamp(end_date, user_timezone)
 
         # Use get_feed_intervals which returns list of dicts with 'start', 'leftDuration', 'rightDuration'
-        intervals = api.get_feed_intervals(child_uid, start_timestamp, end_timestamp)
-
-        result = []
-        for interval in intervals:
-            # Convert timestamp to ISO format in user's timezone
-            start_time = timestamp_to_local_iso(interval["start"], user_timezone)
-
-            # Backend returns duration in seconds, convert to minutes
-            left_mins = interval.get("leftDuration", 0) // 60
-            right_mins = interval.get("rightDuration", 0) // 60
-
-            result.append({
-                "start_time": start_time,
-                "left_duration_minutes": left_mins,
-                "right_duration_minutes": right_mins,
+        # The Firestore query is blocking; run it in a worker thread so the
+        # event loop keeps serving other tool calls
+        intervals = await asyncio.to_thread(
+            api.get_feed_intervals, child_uid, start_timestamp, end_timestamp
+        )
+
+        # Short-circuit the common "no feedings in window" case
+        if not intervals:
+            return []
+
+        # Backend returns durations in seconds; convert to minutes per row
+        return [
+            {
+                "start_time": timestamp_to_local_iso(interval["start"], user_timezone),
+                "left_duration_minutes": interval.get("leftDuration", 0) // 60,
+                "right_duration_minutes": interval.get("rightDuration", 0) // 60,
                 "is_multi_entry": interval.get("is_multi_entry", False),
-            })
-
-        return result
+            }
+            for interval in intervals
+        ]
 
     except Exception as e:
         raise Exception(f"Failed to get feeding history: {str(e)}")
@@ -618,6 +812,7 @@ async def get_feeding_history(
 def register_feeding_tools(mcp):
     """Register feeding tracking tools with FastMCP instance."""
     mcp.tool()(log_bottle_feeding)
+    mcp.tool()(log_bottle_feedings)
     mcp.tool()(log_breastfeeding)
     mcp.tool()(start_breastfeeding)
     mcp.tool()(pause_feeding)
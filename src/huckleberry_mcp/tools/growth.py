@@ -4,8 +4,7 @@ import time
 import uuid
 from typing import Any, Dict, List, Optional
 from datetime import datetime, timezone, timedelta
-from ..auth import get_authenticated_api
-from .children import validate_child_uid
+from .children import resolve_child
 from ..utils import iso_to_timestamp, iso_datetime_to_timestamp, timestamp_to_local_iso
 
 
@@ -45,8 +44,7 @@ async def log_growth(
         Exception: When API fails
     """
     try:
-        await validate_child_uid(child_uid)
-
+        # Reject bad arguments before any awaited round trip
         if units not in ["imperial", "metric"]:
             raise ValueError(
                 f"Invalid units '{units}'. Must be 'imperial' or 'metric'."
@@ -57,7 +55,7 @@ async def log_growth(
                 "At least one measurement (weight, height, or head) must be provided."
             )
 
-        api = await get_authenticated_api()
+        api, _ = await resolve_child(child_uid)
 
         # Determine timestamp to use
         if timestamp:
@@ -173,8 +171,7 @@ async def get_latest_growth(child_uid: str) -> Dict[str, Any]:
         Exception: When API fails
     """
     try:
-        await validate_child_uid(child_uid)
-        api = await get_authenticated_api()
+        api, _ = await resolve_child(child_uid)
 
         growth_data = api.get_growth_data(child_uid)
 
@@ -227,8 +224,7 @@ async def get_growth_history(
         Exception: When API fails
     """
     try:
-        await validate_child_uid(child_uid)
-        api = await get_authenticated_api()
+        api, _ = await resolve_child(child_uid)
 
         # Get user's timezone for proper date interpretation
         user_timezone = api._timezone
@@ -18,8 +18,7 @@ import time
 import uuid
 from typing import Any, Dict, List, Optional
 from datetime import datetime, timezone, timedelta
-from ..auth import get_authenticated_api
-from .children import validate_child_uid
+from .children import resolve_child
 from ..utils import iso_to_timestamp, iso_datetime_to_timestamp, timestamp_to_local_iso
 
 
@@ -55,8 +54,7 @@ async def log_sleep(
         Exception: When API fails
     """
     try:
-        await validate_child_uid(child_uid)
-        api = await get_authenticated_api()
+        api, _ = await resolve_child(child_uid)
 
         # Validate inputs
         if end_time is None and duration_minutes is None:
@@ -176,8 +174,11 @@ async def start_sleep(child_uid: str) -> Dict[str, Any]:
         Exception: If a sleep session is already active for this child, or API fails
     """
     try:
-        await validate_child_uid(child_uid)
-        api = await get_authenticated_api()
+        api, _ = await resolve_child(child_uid)
+
+        # Snapshot the clock before the RPC so the reported timestamp
+        # reflects when the operation was initiated
+        now = time.time()
 
         # Start sleep timer
         api.start_sleep(child_uid)
@@ -185,7 +186,7 @@ async def start_sleep(child_uid: str) -> Dict[str, Any]:
         return {
             "success": True,
             "message": f"Sleep tracking started for child {child_uid}",
-            "timestamp": timestamp_to_local_iso(time.time(), api._timezone)
+            "timestamp": timestamp_to_local_iso(now, api._timezone)
         }
 
     except ValueError as e:
@@ -215,8 +216,11 @@ async def pause_sleep(child_uid: str) -> Dict[str, Any]:
         A sleep session must be active and running (started via start_sleep, not paused).
     """
     try:
-        await validate_child_uid(child_uid)
-        api = await get_authenticated_api()
+        api, _ = await resolve_child(child_uid)
+
+        # Snapshot the clock before the RPC so the reported timestamp
+        # reflects when the operation was initiated
+        now = time.time()
 
         # Pause sleep timer
         api.pause_sleep(child_uid)
@@ -224,7 +228,7 @@ async def pause_sleep(child_uid: str) -> Dict[str, Any]:
         return {
             "success": True,
             "message": f"Sleep tracking paused for child {child_uid}",
-            "timestamp": timestamp_to_local_iso(time.time(), api._timezone)
+            "timestamp": timestamp_to_local_iso(now, api._timezone)
         }
 
     except ValueError as e:
@@ -254,8 +258,11 @@ async def resume_sleep(child_uid: str) -> Dict[str, Any]:
         A sleep session must be paused (via pause_sleep).
     """
     try:
-        await validate_child_uid(child_uid)
-        api = await get_authenticated_api()
+        api, _ = await resolve_child(child_uid)
+
+        # Snapshot the clock before the RPC so the reported timestamp
+        # reflects when the operation was initiated
+        now = time.time()
 
         # Resume sleep timer
         api.resume_sleep(child_uid)
@@ -263,7 +270,7 @@ async def resume_sleep(child_uid: str) -> Dict[str, Any]:
         return {
             "success": True,
             "message": f"Sleep tracking resumed for child {child_uid}",
-            "timestamp": timestamp_to_local_iso(time.time(), api._timezone)
+            "timestamp": timestamp_to_local_iso(now, api._timezone)
         }
 
     except ValueError as e:
@@ -295,8 +302,11 @@ async def complete_sleep(child_uid: str) -> Dict[str, Any]:
         A sleep session must be active (running or paused).
     """
     try:
-        await validate_child_uid(child_uid)
-        api = await get_authenticated_api()
+        api, _ = await resolve_child(child_uid)
+
+        # Snapshot the clock before the RPC so the reported timestamp
+        # reflects when the operation was initiated
+        now = time.time()
 
         # Complete sleep timer
         api.complete_sleep(child_uid)
@@ -304,7 +314,7 @@ async def complete_sleep(child_uid: str) -> Dict[str, Any]:
         return {
             "success": True,
             "message": f"Sleep tracking completed and saved for child {child_uid}",
-            "timestamp": timestamp_to_local_iso(time.time(), api._timezone)
+            "timestamp": timestamp_to_local_iso(now, api._timezone)
         }
 
     except ValueError as e:
@@ -336,8 +346,11 @@ async def cancel_sleep(child_uid: str) -> Dict[str, Any]:
         A sleep session must be active (running or paused).
     """
     try:
-        await validate_child_uid(child_uid)
-        api = await get_authenticated_api()
+        api, _ = await resolve_child(child_uid)
+
+        # Snapshot the clock before the RPC so the reported timestamp
+        # reflects when the operation was initiated
+        now = time.time()
 
         # Cancel sleep timer
         api.cancel_sleep(child_uid)
@@ -345,7 +358,7 @@ async def cancel_sleep(child_uid: str) -> Dict[str, Any]:
         return {
             "success": True,
             "message": f"Sleep tracking cancelled for child {child_uid}",
-            "timestamp": timestamp_to_local_iso(time.time(), api._timezone)
+            "timestamp": timestamp_to_local_iso(now, api._timezone)
         }
 
     except ValueError as e:
@@ -377,8 +390,7 @@ async def get_sleep_history(
         Exception: When API fails
     """
     try:
-        await validate_child_uid(child_uid)
-        api = await get_authenticated_api()
+        api, _ = await resolve_child(child_uid)
 
         # Get user's timezone for proper date interpretation
         user_timezone = api._timezone
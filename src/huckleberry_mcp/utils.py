@@ -1,11 +1,16 @@
 """Shared utility functions for Huckleberry MCP server."""
 
 from datetime import datetime, timezone
+from functools import lru_cache
 
 
+@lru_cache(maxsize=256)
 def iso_to_timestamp(iso_date: str, user_timezone=None) -> int:
     """Convert ISO date string (YYYY-MM-DD) to Unix timestamp.
 
+    The conversion is pure and history tools pass the same date window
+    repeatedly, so results are memoized (ZoneInfo objects are hashable).
+
     Args:
         iso_date: Date string in YYYY-MM-DD format
         user_timezone: ZoneInfo object. If provided, interprets date as midnight in this timezone.
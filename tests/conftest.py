@@ -0,0 +1,20 @@
+"""Shared pytest fixtures."""
+
+import pytest
+from huckleberry_mcp.tools.children import invalidate_children_cache
+from huckleberry_mcp.tools.diaper import _last_diaper_ts
+from huckleberry_mcp.tools.feeding import _last_bottle_ts, _last_nursing_ts
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    """Clear the cached children roster and last-event markers between tests."""
+    invalidate_children_cache()
+    _last_diaper_ts.clear()
+    _last_bottle_ts.clear()
+    _last_nursing_ts.clear()
+    yield
+    invalidate_children_cache()
+    _last_diaper_ts.clear()
+    _last_bottle_ts.clear()
+    _last_nursing_ts.clear()
@@ -1,5 +1,6 @@
 """Tests for authentication module."""
 
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from huckleberry_mcp.auth import HuckleberryAuth, HuckleberryAuthError, get_authenticated_api
@@ -107,3 +108,33 @@ async def test_get_api_authenticated(auth, mock_env):
         api = auth.get_api()
 
         assert api is mock_api
+
+
+@pytest.mark.asyncio
+async def test_get_authenticated_api_concurrent_single_auth(mock_env):
+    """Test that concurrent cold-start callers authenticate only once."""
+    fresh_auth = HuckleberryAuth()
+    real_authenticate = fresh_auth.authenticate
+
+    async def slow_authenticate():
+        # The mocked auth path has no await point of its own, so yield to
+        # the event loop first; without the lock every gathered caller
+        # would then start its own authentication.
+        await asyncio.sleep(0)
+        await real_authenticate()
+
+    fresh_auth.authenticate = slow_authenticate
+
+    with patch("huckleberry_mcp.auth._auth", fresh_auth):
+        with patch("huckleberry_mcp.auth.HuckleberryAPI") as mock_api_class:
+            mock_api = AsyncMock()
+            # get_children is synchronous, not async! Use MagicMock for synchronous methods
+            mock_api.get_children = MagicMock(return_value=[])
+            mock_api_class.return_value = mock_api
+
+            results = await asyncio.gather(
+                *(get_authenticated_api() for _ in range(5))
+            )
+
+            assert all(api is mock_api for api in results)
+            mock_api_class.assert_called_once()
@@ -0,0 +1,93 @@
+"""Tests for batch execution tools."""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+from huckleberry_mcp.tools.batch import batch_execute, DISPATCH
+
+
+@pytest.mark.asyncio
+async def test_batch_execute_success():
+    """Test executing multiple calls in one batch."""
+    mock_diaper = AsyncMock(return_value={"success": True, "mode": "both"})
+    mock_children = AsyncMock(return_value=[{"uid": "child1", "name": "Alice"}])
+
+    with patch.dict(DISPATCH, {"log_diaper": mock_diaper, "list_children": mock_children}):
+        results = await batch_execute([
+            {"name": "log_diaper", "arguments": {"child_uid": "child1", "mode": "both"}},
+            {"name": "list_children"},
+        ])
+
+        assert len(results) == 2
+        assert results[0]["name"] == "log_diaper"
+        assert results[0]["success"] is True
+        assert results[0]["result"]["mode"] == "both"
+        assert results[1]["success"] is True
+        mock_diaper.assert_awaited_once_with(child_uid="child1", mode="both")
+
+
+@pytest.mark.asyncio
+async def test_batch_execute_unknown_tool():
+    """Test that an unknown tool name is rejected before any call runs."""
+    with pytest.raises(ValueError, match="Unknown tool"):
+        await batch_execute([{"name": "not_a_tool", "arguments": {}}])
+
+
+@pytest.mark.asyncio
+async def test_batch_execute_empty_calls():
+    """Test that an empty batch is rejected."""
+    with pytest.raises(ValueError, match="non-empty"):
+        await batch_execute([])
+
+
+@pytest.mark.asyncio
+async def test_batch_execute_records_per_call_errors():
+    """Test that a failing call does not abort the batch by default."""
+    mock_ok = AsyncMock(return_value={"success": True})
+    mock_bad = AsyncMock(side_effect=Exception("API down"))
+
+    with patch.dict(DISPATCH, {"start_sleep": mock_ok, "log_diaper": mock_bad}):
+        results = await batch_execute([
+            {"name": "log_diaper", "arguments": {"child_uid": "child1"}},
+            {"name": "start_sleep", "arguments": {"child_uid": "child1"}},
+        ])
+
+        assert results[0]["success"] is False
+        assert "API down" in results[0]["error"]
+        assert results[1]["success"] is True
+
+
+@pytest.mark.asyncio
+async def test_batch_execute_stop_on_error():
+    """Test that stop_on_error raises the first failure."""
+    mock_bad = AsyncMock(side_effect=Exception("API down"))
+
+    with patch.dict(DISPATCH, {"log_diaper": mock_bad}):
+        with pytest.raises(Exception, match="API down"):
+            await batch_execute(
+                [{"name": "log_diaper", "arguments": {"child_uid": "child1"}}],
+                stop_on_error=True,
+            )
+
+
+@pytest.mark.asyncio
+async def test_batch_execute_stop_on_error_cancels_pending():
+    """Test that stop_on_error cancels calls that have not run yet."""
+    mock_bad = AsyncMock(side_effect=Exception("API down"))
+
+    async def slow_sleep(**kwargs):
+        await asyncio.sleep(30)
+        return {"success": True}
+
+    with patch.dict(DISPATCH, {"log_diaper": mock_bad, "start_sleep": slow_sleep}):
+        with pytest.raises(Exception, match="API down"):
+            await asyncio.wait_for(
+                batch_execute(
+                    [
+                        {"name": "log_diaper", "arguments": {"child_uid": "child1"}},
+                        {"name": "start_sleep", "arguments": {"child_uid": "child1"}},
+                    ],
+                    stop_on_error=True,
+                ),
+                timeout=5,
+            )
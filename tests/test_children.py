@@ -61,3 +61,14 @@ async def test_get_child_name_not_found(mock_api):
     with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
         result = await get_child_name("invalid_uid")
         assert result is None
+
+
+@pytest.mark.asyncio
+async def test_children_roster_is_cached(mock_api):
+    """Test that repeated validations reuse the cached roster."""
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+        await validate_child_uid("child1")
+        await validate_child_uid("child2")
+        await get_child_name("child1")
+
+        mock_api.get_children.assert_called_once()
@@ -39,8 +39,7 @@ def mock_api():
 @pytest.mark.asyncio
 async def test_log_diaper_success(mock_api):
     """Test logging a diaper change."""
-    with patch("huckleberry_mcp.tools.diaper.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         result = await diaper.log_diaper("child1", "both")
 
@@ -51,8 +50,7 @@ async def test_log_diaper_success(mock_api):
 @pytest.mark.asyncio
 async def test_log_diaper_with_details(mock_api):
     """Test logging a diaper change with color and consistency."""
-    with patch("huckleberry_mcp.tools.diaper.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         result = await diaper.log_diaper(
             "child1",
@@ -69,8 +67,7 @@ async def test_log_diaper_with_details(mock_api):
 @pytest.mark.asyncio
 async def test_log_diaper_invalid_mode(mock_api):
     """Test logging diaper with invalid mode."""
-    with patch("huckleberry_mcp.tools.diaper.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         with pytest.raises(ValueError, match="Invalid mode"):
             await diaper.log_diaper("child1", "invalid")
@@ -79,8 +76,7 @@ async def test_log_diaper_invalid_mode(mock_api):
 @pytest.mark.asyncio
 async def test_log_diaper_invalid_color(mock_api):
     """Test logging diaper with invalid poo color."""
-    with patch("huckleberry_mcp.tools.diaper.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         with pytest.raises(ValueError, match="Invalid color"):
             await diaper.log_diaper("child1", "poo", color="purple")
@@ -100,8 +96,7 @@ async def test_get_diaper_history(mock_api):
         }
     ])
 
-    with patch("huckleberry_mcp.tools.diaper.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         result = await diaper.get_diaper_history("child1", "2024-01-01", "2024-01-02")
 
@@ -111,11 +106,110 @@ async def test_get_diaper_history(mock_api):
         assert result[0]["consistency"] == "solid"
 
 
+@pytest.mark.asyncio
+async def test_log_diapers_batch(mock_api):
+    """Test logging multiple diaper changes in one batch."""
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+
+        result = await diaper.log_diapers_batch("child1", [
+            {"mode": "pee", "timestamp": "2024-01-15T08:00:00Z"},
+            {"mode": "both", "color": "brown", "timestamp": "2024-01-15T12:00:00Z"},
+        ])
+
+        assert result["success"] is True
+        assert result["count"] == 2
+        assert result["batches"] == 1
+        mock_batch = mock_api._get_firestore_client.return_value.batch.return_value
+        mock_batch.commit.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_log_diapers_batch_invalid_entry(mock_api):
+    """Test that one invalid entry rejects the whole batch before writing."""
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+
+        with pytest.raises(ValueError, match="Invalid mode"):
+            await diaper.log_diapers_batch("child1", [
+                {"mode": "pee"},
+                {"mode": "invalid"},
+            ])
+
+        mock_batch = mock_api._get_firestore_client.return_value.batch.return_value
+        mock_batch.commit.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_log_diaper_older_than_marker_skips_prefs(mock_api):
+    """Test that a diaper entry older than the session marker skips prefs.lastDiaper."""
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+
+        # Current-time log sets the session marker and updates prefs
+        await diaper.log_diaper("child1", "pee")
+        mock_batch = mock_api._get_firestore_client.return_value.batch.return_value
+        assert mock_batch.update.call_count == 1
+        assert "prefs.lastDiaper" in mock_batch.update.call_args[0][1]
+
+        # Backfilling an older entry must not move prefs.lastDiaper backwards
+        await diaper.log_diaper("child1", "poo", timestamp="2024-01-15T10:30:00Z")
+
+        assert mock_batch.set.call_count == 2
+        assert mock_batch.update.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_log_diaper_newer_than_marker_updates_prefs(mock_api):
+    """Test that an entry newer than the session marker updates prefs.lastDiaper."""
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+
+        await diaper.log_diaper("child1", "pee", timestamp="2024-01-15T08:00:00Z")
+        await diaper.log_diaper("child1", "poo", timestamp="2024-01-15T12:00:00Z")
+
+        mock_batch = mock_api._get_firestore_client.return_value.batch.return_value
+        assert mock_batch.set.call_count == 2
+        assert mock_batch.update.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_log_diapers_batch_older_than_marker_skips_prefs(mock_api):
+    """Test that a bulk import of older entries leaves prefs.lastDiaper alone."""
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+
+        # Current-time log sets the session marker and updates prefs
+        await diaper.log_diaper("child1", "pee")
+        mock_batch = mock_api._get_firestore_client.return_value.batch.return_value
+        assert mock_batch.update.call_count == 1
+
+        # Every imported entry is older than the marker, so no prefs update
+        await diaper.log_diapers_batch("child1", [
+            {"mode": "pee", "timestamp": "2024-01-15T08:00:00Z"},
+            {"mode": "both", "timestamp": "2024-01-15T12:00:00Z"},
+        ])
+
+        assert mock_batch.set.call_count == 3
+        assert mock_batch.update.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_log_diapers_batch_newer_than_marker_updates_prefs(mock_api):
+    """Test that a bulk import with a newer entry updates prefs.lastDiaper."""
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+
+        await diaper.log_diaper("child1", "pee", timestamp="2024-01-15T08:00:00Z")
+        mock_batch = mock_api._get_firestore_client.return_value.batch.return_value
+        assert mock_batch.update.call_count == 1
+
+        await diaper.log_diapers_batch("child1", [
+            {"mode": "both", "timestamp": "2024-01-15T12:00:00Z"},
+        ])
+
+        assert mock_batch.update.call_count == 2
+        assert "prefs.lastDiaper" in mock_batch.update.call_args[0][1]
+
+
 @pytest.mark.asyncio
 async def test_log_diaper_with_timestamp(mock_api):
     """Test logging diaper with custom timestamp for retroactive logging."""
-    with patch("huckleberry_mcp.tools.diaper.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         result = await diaper.log_diaper(
             "child1",
@@ -44,8 +44,7 @@ def mock_api():
 @pytest.mark.asyncio
 async def test_start_breastfeeding_success(mock_api):
     """Test starting a breastfeeding session."""
-    with patch("huckleberry_mcp.tools.feeding.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         result = await feeding.start_breastfeeding("child1", "left")
 
@@ -57,8 +56,7 @@ async def test_start_breastfeeding_success(mock_api):
 @pytest.mark.asyncio
 async def test_start_breastfeeding_invalid_side(mock_api):
     """Test starting breastfeeding with invalid side."""
-    with patch("huckleberry_mcp.tools.feeding.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         with pytest.raises(ValueError, match="Invalid side"):
             await feeding.start_breastfeeding("child1", "middle")
@@ -67,8 +65,7 @@ async def test_start_breastfeeding_invalid_side(mock_api):
 @pytest.mark.asyncio
 async def test_switch_feeding_side_success(mock_api):
     """Test switching feeding sides."""
-    with patch("huckleberry_mcp.tools.feeding.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         result = await feeding.switch_feeding_side("child1")
 
@@ -91,8 +88,7 @@ async def test_get_feeding_history(mock_api):
         }
     ])
 
-    with patch("huckleberry_mcp.tools.feeding.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         result = await feeding.get_feeding_history("child1", "2024-01-01", "2024-01-02")
 
@@ -104,8 +100,7 @@ async def test_get_feeding_history(mock_api):
 @pytest.mark.asyncio
 async def test_log_breastfeeding_with_durations(mock_api):
     """Test logging breastfeeding with left and right durations."""
-    with patch("huckleberry_mcp.tools.feeding.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         result = await feeding.log_breastfeeding(
             "child1",
@@ -125,8 +120,7 @@ async def test_log_breastfeeding_with_durations(mock_api):
 @pytest.mark.asyncio
 async def test_log_breastfeeding_with_end_time(mock_api):
     """Test logging breastfeeding with end_time."""
-    with patch("huckleberry_mcp.tools.feeding.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         result = await feeding.log_breastfeeding(
             "child1",
@@ -145,8 +139,7 @@ async def test_log_breastfeeding_with_end_time(mock_api):
 @pytest.mark.asyncio
 async def test_log_breastfeeding_left_only(mock_api):
     """Test logging breastfeeding with only left duration."""
-    with patch("huckleberry_mcp.tools.feeding.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         result = await feeding.log_breastfeeding(
             "child1",
@@ -163,8 +156,7 @@ async def test_log_breastfeeding_left_only(mock_api):
 @pytest.mark.asyncio
 async def test_log_breastfeeding_no_duration_or_end_time(mock_api):
     """Test logging breastfeeding without duration or end_time raises error."""
-    with patch("huckleberry_mcp.tools.feeding.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         with pytest.raises(ValueError, match="Must provide either end_time OR"):
             await feeding.log_breastfeeding("child1", start_time="2024-01-01T14:00:00Z")
@@ -173,8 +165,7 @@ async def test_log_breastfeeding_no_duration_or_end_time(mock_api):
 @pytest.mark.asyncio
 async def test_log_breastfeeding_both_end_time_and_durations(mock_api):
     """Test logging breastfeeding with both end_time and durations raises error."""
-    with patch("huckleberry_mcp.tools.feeding.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         with pytest.raises(ValueError, match="When using end_time, do not specify"):
             await feeding.log_breastfeeding(
@@ -188,8 +179,7 @@ async def test_log_breastfeeding_both_end_time_and_durations(mock_api):
 @pytest.mark.asyncio
 async def test_log_breastfeeding_end_time_without_last_side(mock_api):
     """Test logging breastfeeding with end_time but no last_side raises error."""
-    with patch("huckleberry_mcp.tools.feeding.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         with pytest.raises(ValueError, match="When using end_time, last_side is required"):
             await feeding.log_breastfeeding(
@@ -202,8 +192,7 @@ async def test_log_breastfeeding_end_time_without_last_side(mock_api):
 @pytest.mark.asyncio
 async def test_log_breastfeeding_invalid_last_side(mock_api):
     """Test logging breastfeeding with invalid last_side raises error."""
-    with patch("huckleberry_mcp.tools.feeding.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         with pytest.raises(ValueError, match="Invalid last_side"):
             await feeding.log_breastfeeding(
@@ -228,8 +217,7 @@ async def test_get_feeding_history_multi_entry(mock_api):
         }
     ])
 
-    with patch("huckleberry_mcp.tools.feeding.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         result = await feeding.get_feeding_history("child1", "2024-01-01", "2024-01-02")
 
@@ -244,8 +232,7 @@ async def test_get_feeding_history_multi_entry(mock_api):
 @pytest.mark.asyncio
 async def test_log_bottle_feeding_success(mock_api):
     """Test logging bottle feeding with default values."""
-    with patch("huckleberry_mcp.tools.feeding.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         result = await feeding.log_bottle_feeding("child1", amount=4.0)
 
@@ -260,8 +247,7 @@ async def test_log_bottle_feeding_success(mock_api):
 @pytest.mark.asyncio
 async def test_log_bottle_feeding_breast_milk(mock_api):
     """Test logging bottle feeding with breast milk."""
-    with patch("huckleberry_mcp.tools.feeding.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         result = await feeding.log_bottle_feeding(
             "child1",
@@ -279,8 +265,7 @@ async def test_log_bottle_feeding_breast_milk(mock_api):
 @pytest.mark.asyncio
 async def test_log_bottle_feeding_mixed(mock_api):
     """Test logging bottle feeding with mixed content."""
-    with patch("huckleberry_mcp.tools.feeding.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         result = await feeding.log_bottle_feeding(
             "child1",
@@ -297,8 +282,7 @@ async def test_log_bottle_feeding_mixed(mock_api):
 @pytest.mark.asyncio
 async def test_log_bottle_feeding_with_timestamp(mock_api):
     """Test logging bottle feeding with retroactive timestamp."""
-    with patch("huckleberry_mcp.tools.feeding.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         result = await feeding.log_bottle_feeding(
             "child1",
@@ -312,11 +296,121 @@ async def test_log_bottle_feeding_with_timestamp(mock_api):
         assert "2024-01-01" in result["timestamp"]
 
 
+@pytest.mark.asyncio
+async def test_log_bottle_feeding_retroactive_skips_prefs(mock_api):
+    """Test that a fresh-session retroactive entry does not touch prefs.lastBottle."""
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+
+        result = await feeding.log_bottle_feeding(
+            "child1",
+            amount=4.0,
+            timestamp="2024-01-01T14:30:00Z"
+        )
+
+        assert result["success"] is True
+        mock_batch = mock_api._get_firestore_client.return_value.batch.return_value
+        mock_batch.set.assert_called_once()
+        mock_batch.update.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_log_bottle_feeding_current_updates_prefs(mock_api):
+    """Test that a current-time entry updates prefs.lastBottle."""
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+
+        result = await feeding.log_bottle_feeding("child1", amount=4.0)
+
+        assert result["success"] is True
+        mock_batch = mock_api._get_firestore_client.return_value.batch.return_value
+        mock_batch.set.assert_called_once()
+        mock_batch.update.assert_called_once()
+        update_payload = mock_batch.update.call_args[0][1]
+        assert "prefs.lastBottle" in update_payload
+
+
+@pytest.mark.asyncio
+async def test_log_bottle_feeding_older_than_marker_skips_prefs(mock_api):
+    """Test that an entry older than the session's newest feeding skips prefs.lastBottle."""
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+
+        # Current-time log sets the session marker and updates prefs
+        await feeding.log_bottle_feeding("child1", amount=4.0)
+        mock_batch = mock_api._get_firestore_client.return_value.batch.return_value
+        assert mock_batch.update.call_count == 1
+
+        # Backfilling an older entry must not move prefs.lastBottle backwards
+        await feeding.log_bottle_feeding(
+            "child1",
+            amount=2.0,
+            timestamp="2024-01-01T14:30:00Z"
+        )
+
+        assert mock_batch.set.call_count == 2
+        assert mock_batch.update.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_log_breastfeeding_older_than_marker_skips_prefs(mock_api):
+    """Test that a breastfeeding entry older than the session marker skips prefs.lastNursing."""
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+
+        # First entry of the session always updates prefs and sets the marker
+        await feeding.log_breastfeeding(
+            "child1",
+            start_time="2024-01-02T14:00:00Z",
+            left_duration_minutes=10
+        )
+        mock_batch = mock_api._get_firestore_client.return_value.batch.return_value
+        assert mock_batch.update.call_count == 1
+        assert "prefs.lastNursing" in mock_batch.update.call_args[0][1]
+
+        # An older backfilled entry must leave prefs.lastNursing alone
+        await feeding.log_breastfeeding(
+            "child1",
+            start_time="2024-01-01T14:00:00Z",
+            left_duration_minutes=10
+        )
+
+        assert mock_batch.set.call_count == 2
+        assert mock_batch.update.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_log_bottle_feedings_batch(mock_api):
+    """Test logging multiple bottle feedings in one batch."""
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+
+        result = await feeding.log_bottle_feedings("child1", [
+            {"amount": 4.0, "timestamp": "2024-01-15T08:00:00Z"},
+            {"amount": 120, "bottle_type": "Breast Milk", "units": "ml"},
+        ])
+
+        assert result["success"] is True
+        assert result["count"] == 2
+        assert result["batches"] == 1
+        mock_batch = mock_api._get_firestore_client.return_value.batch.return_value
+        mock_batch.commit.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_log_bottle_feedings_invalid_entry(mock_api):
+    """Test that one invalid entry rejects the whole batch before writing."""
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+
+        with pytest.raises(ValueError, match="Invalid units"):
+            await feeding.log_bottle_feedings("child1", [
+                {"amount": 4.0},
+                {"amount": 2.0, "units": "cups"},
+            ])
+
+        mock_batch = mock_api._get_firestore_client.return_value.batch.return_value
+        mock_batch.commit.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_log_bottle_feeding_invalid_type(mock_api):
     """Test logging bottle feeding with invalid bottle_type raises error."""
-    with patch("huckleberry_mcp.tools.feeding.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         with pytest.raises(ValueError, match="Invalid bottle_type"):
             await feeding.log_bottle_feeding("child1", amount=4.0, bottle_type="water")
@@ -325,8 +419,7 @@ async def test_log_bottle_feeding_invalid_type(mock_api):
 @pytest.mark.asyncio
 async def test_log_bottle_feeding_invalid_units(mock_api):
     """Test logging bottle feeding with invalid units raises error."""
-    with patch("huckleberry_mcp.tools.feeding.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         with pytest.raises(ValueError, match="Invalid units"):
             await feeding.log_bottle_feeding("child1", amount=4.0, units="cups")
@@ -335,8 +428,7 @@ async def test_log_bottle_feeding_invalid_units(mock_api):
 @pytest.mark.asyncio
 async def test_log_bottle_feeding_zero_amount(mock_api):
     """Test logging bottle feeding with zero amount raises error."""
-    with patch("huckleberry_mcp.tools.feeding.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         with pytest.raises(ValueError, match="Amount must be a positive number"):
             await feeding.log_bottle_feeding("child1", amount=0)
@@ -345,8 +437,7 @@ async def test_log_bottle_feeding_zero_amount(mock_api):
 @pytest.mark.asyncio
 async def test_log_bottle_feeding_negative_amount(mock_api):
     """Test logging bottle feeding with negative amount raises error."""
-    with patch("huckleberry_mcp.tools.feeding.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         with pytest.raises(ValueError, match="Amount must be a positive number"):
             await feeding.log_bottle_feeding("child1", amount=-2.5)
@@ -44,8 +44,7 @@ def mock_api():
 @pytest.mark.asyncio
 async def test_log_growth_weight_only(mock_api):
     """Test logging weight measurement only."""
-    with patch("huckleberry_mcp.tools.growth.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         result = await growth.log_growth("child1", weight=10.5)
 
@@ -57,8 +56,7 @@ async def test_log_growth_weight_only(mock_api):
 @pytest.mark.asyncio
 async def test_log_growth_all_measurements(mock_api):
     """Test logging all growth measurements."""
-    with patch("huckleberry_mcp.tools.growth.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         result = await growth.log_growth(
             "child1",
@@ -77,8 +75,7 @@ async def test_log_growth_all_measurements(mock_api):
 @pytest.mark.asyncio
 async def test_log_growth_metric_units(mock_api):
     """Test logging growth with metric units."""
-    with patch("huckleberry_mcp.tools.growth.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         result = await growth.log_growth("child1", weight=5.0, units="metric")
 
@@ -89,8 +86,7 @@ async def test_log_growth_metric_units(mock_api):
 @pytest.mark.asyncio
 async def test_log_growth_no_measurements(mock_api):
     """Test logging growth with no measurements."""
-    with patch("huckleberry_mcp.tools.growth.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         with pytest.raises(ValueError, match="At least one measurement"):
             await growth.log_growth("child1")
@@ -99,8 +95,7 @@ async def test_log_growth_no_measurements(mock_api):
 @pytest.mark.asyncio
 async def test_log_growth_invalid_units(mock_api):
     """Test logging growth with invalid units."""
-    with patch("huckleberry_mcp.tools.growth.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         with pytest.raises(ValueError, match="Invalid units"):
             await growth.log_growth("child1", weight=10.5, units="invalid")
@@ -119,8 +114,7 @@ async def test_get_latest_growth(mock_api):
         "timestamp_sec": 1704103200
     })
 
-    with patch("huckleberry_mcp.tools.growth.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         result = await growth.get_latest_growth("child1")
 
@@ -138,8 +132,7 @@ async def test_get_latest_growth_no_data(mock_api):
         "head_units": "hcm"
     })
 
-    with patch("huckleberry_mcp.tools.growth.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         result = await growth.get_latest_growth("child1")
 
@@ -158,8 +151,7 @@ async def test_get_growth_history(mock_api):
         }
     ])
 
-    with patch("huckleberry_mcp.tools.growth.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         result = await growth.get_growth_history("child1", "2024-01-01", "2024-01-31")
 
@@ -172,8 +164,7 @@ async def test_get_growth_history(mock_api):
 @pytest.mark.asyncio
 async def test_log_growth_with_timestamp(mock_api):
     """Test logging growth with custom timestamp for retroactive logging."""
-    with patch("huckleberry_mcp.tools.growth.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         result = await growth.log_growth(
             "child1",
@@ -43,8 +43,7 @@ def mock_api():
 @pytest.mark.asyncio
 async def test_start_sleep_success(mock_api):
     """Test starting a sleep session."""
-    with patch("huckleberry_mcp.tools.sleep.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         result = await sleep.start_sleep("child1")
 
@@ -56,8 +55,7 @@ async def test_start_sleep_success(mock_api):
 @pytest.mark.asyncio
 async def test_pause_sleep_success(mock_api):
     """Test pausing a sleep session."""
-    with patch("huckleberry_mcp.tools.sleep.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         result = await sleep.pause_sleep("child1")
 
@@ -69,8 +67,7 @@ async def test_pause_sleep_success(mock_api):
 @pytest.mark.asyncio
 async def test_resume_sleep_success(mock_api):
     """Test resuming a paused sleep session."""
-    with patch("huckleberry_mcp.tools.sleep.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         result = await sleep.resume_sleep("child1")
 
@@ -82,8 +79,7 @@ async def test_resume_sleep_success(mock_api):
 @pytest.mark.asyncio
 async def test_complete_sleep_success(mock_api):
     """Test completing a sleep session."""
-    with patch("huckleberry_mcp.tools.sleep.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         result = await sleep.complete_sleep("child1")
 
@@ -95,8 +91,7 @@ async def test_complete_sleep_success(mock_api):
 @pytest.mark.asyncio
 async def test_cancel_sleep_success(mock_api):
     """Test cancelling a sleep session."""
-    with patch("huckleberry_mcp.tools.sleep.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         result = await sleep.cancel_sleep("child1")
 
@@ -118,8 +113,7 @@ async def test_get_sleep_history(mock_api):
         }
     ])
 
-    with patch("huckleberry_mcp.tools.sleep.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         result = await sleep.get_sleep_history("child1", "2024-01-01", "2024-01-02")
 
@@ -130,8 +124,7 @@ async def test_get_sleep_history(mock_api):
 @pytest.mark.asyncio
 async def test_log_sleep_with_duration(mock_api):
     """Test logging sleep with duration_minutes."""
-    with patch("huckleberry_mcp.tools.sleep.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         result = await sleep.log_sleep(
             "child1",
@@ -149,8 +142,7 @@ async def test_log_sleep_with_duration(mock_api):
 @pytest.mark.asyncio
 async def test_log_sleep_with_end_time(mock_api):
     """Test logging sleep with end_time."""
-    with patch("huckleberry_mcp.tools.sleep.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         result = await sleep.log_sleep(
             "child1",
@@ -166,8 +158,7 @@ async def test_log_sleep_with_end_time(mock_api):
 @pytest.mark.asyncio
 async def test_log_sleep_no_duration_or_end_time(mock_api):
     """Test logging sleep without duration or end_time raises error."""
-    with patch("huckleberry_mcp.tools.sleep.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         with pytest.raises(ValueError, match="Either end_time or duration_minutes must be provided"):
             await sleep.log_sleep("child1", start_time="2024-01-01T14:00:00Z")
@@ -176,8 +167,7 @@ async def test_log_sleep_no_duration_or_end_time(mock_api):
 @pytest.mark.asyncio
 async def test_log_sleep_both_duration_and_end_time(mock_api):
     """Test logging sleep with both duration and end_time raises error."""
-    with patch("huckleberry_mcp.tools.sleep.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         with pytest.raises(ValueError, match="Provide either end_time or duration_minutes, not both"):
             await sleep.log_sleep(
@@ -191,8 +181,7 @@ async def test_log_sleep_both_duration_and_end_time(mock_api):
 @pytest.mark.asyncio
 async def test_log_sleep_end_before_start(mock_api):
     """Test logging sleep with end_time before start_time raises error."""
-    with patch("huckleberry_mcp.tools.sleep.get_authenticated_api", return_value=mock_api), \
-         patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
+    with patch("huckleberry_mcp.tools.children.get_authenticated_api", return_value=mock_api):
 
         with pytest.raises(ValueError, match="end_time must be after start_time"):
             await sleep.log_sleep(